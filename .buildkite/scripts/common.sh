@@ -15,6 +15,7 @@ XPACK_MODULE_PATTERN="^x-pack\\/[a-z0-9]+beat\\/module\\/([^\\/]+)\\/.*"
 [ -z "${run_metricbeat+x}" ] && run_metricbeat="$(buildkite-agent meta-data get run_metricbeat --default "false")"
 [ -z "${run_packetbeat+x}" ] && run_packetbeat="$(buildkite-agent meta-data get run_packetbeat --default "false")"
 [ -z "${run_winlogbeat+x}" ] && run_winlogbeat="$(buildkite-agent meta-data get run_winlogbeat --default "false")"
+[ -z "${run_xpack_dockerlogbeat+x}" ] && run_xpack_dockerlogbeat="$(buildkite-agent meta-data get run_xpack_dockerlogbeat --default "false")"
 [ -z "${run_xpack_libbeat+x}" ] && run_xpack_libbeat="$(buildkite-agent meta-data get run_xpack_libbeat --default "false")"
 [ -z "${run_xpack_metricbeat+x}" ] && run_xpack_metricbeat="$(buildkite-agent meta-data get run_xpack_metricbeat --default "false")"
 [ -z "${run_xpack_packetbeat+x}" ] && run_xpack_packetbeat="$(buildkite-agent meta-data get run_xpack_packetbeat --default "false")"
@@ -325,15 +326,22 @@ retry() {
   return 0
 }
 
+load_changed_files() {
+  # Runs git diff only once per shell, the result is reused by are_paths_changed and are_changed_only_paths
+  if [ -z "${changed_files_list+x}" ]; then
+    changed_files_list="$(git diff --name-only HEAD@{1} HEAD)" || true
+  fi
+}
+
 are_paths_changed() {
   local patterns=("${@}")
   local changelist=()
-  for pattern in "${patterns[@]}"; do
-    changed_files=($(git diff --name-only HEAD@{1} HEAD | grep -E "$pattern"))
-    if [ "${#changed_files[@]}" -gt 0 ]; then
-      changelist+=("${changed_files[@]}")
-    fi
-  done
+  if [ "${#patterns[@]}" -gt 0 ]; then
+    load_changed_files
+    # match all the patterns in a single pass: (p1)|(p2)|...
+    local union_pattern="$(printf '(%s)|' "${patterns[@]}")"
+    changelist=($(grep -E "${union_pattern%|}" <<< "${changed_files_list}"))
+  fi
 
   if [ "${#changelist[@]}" -gt 0 ]; then
     echo "Files changed:"
@@ -348,7 +356,8 @@ are_paths_changed() {
 
 are_changed_only_paths() {
   local patterns=("${@}")
-  local changed_files=($(git diff --name-only HEAD@{1} HEAD))
+  load_changed_files
+  local changed_files=(${changed_files_list})
   local matched_files=()
   for pattern in "${patterns[@]}"; do
     local matched=($(grep -E "${pattern}" <<< "${changed_files[@]}"))
@@ -363,10 +372,15 @@ are_changed_only_paths() {
 }
 
 are_conditions_met_mandatory_tests() {
-  if are_paths_changed "${mandatory_changeset[@]}" || [[ "${GITHUB_PR_TRIGGER_COMMENT}" == "${BEATS_GH_COMMENT}" || "${GITHUB_PR_LABELS}" =~ /(?i)${BEATS_GH_LABEL}/ || "${!TRIGGER_SPECIFIC_BEAT}" == "true" ]]; then
-    return 0
+  # The result is evaluated once and reused by the other are_conditions_met_* checks
+  if [ -z "${mandatory_tests_met+x}" ]; then
+    if are_paths_changed "${mandatory_changeset[@]}" || [[ "${GITHUB_PR_TRIGGER_COMMENT}" == "${BEATS_GH_COMMENT}" || "${GITHUB_PR_LABELS}" =~ /(?i)${BEATS_GH_LABEL}/ || "${!TRIGGER_SPECIFIC_BEAT}" == "true" ]]; then
+      mandatory_tests_met="true"
+    else
+      mandatory_tests_met="false"
+    fi
   fi
-  return 1
+  [[ "${mandatory_tests_met}" == "true" ]]
 }
 
 are_conditions_met_arm_tests() {
@@ -36,6 +36,9 @@ steps:
         artifact_paths: "${BEATS_PROJECT_NAME}/build/*.xml"
 
 YAML
+else
+  echo "The conditions don't match to requirements for generating pipeline steps."
+  exit 0
 fi
 
 echo "Check and add the Packaging into the pipeline"
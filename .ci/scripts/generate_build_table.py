@@ -3,6 +3,11 @@
 import os
 import yaml
 
+try:
+    from yaml import CSafeLoader
+except ImportError:
+    from yaml import SafeLoader as CSafeLoader
+
 if __name__ == "__main__":
 
     print("| Beat  | Stage  | Category | Command  | MODULE  | Platforms  | When |")
@@ -12,7 +17,7 @@ if __name__ == "__main__":
         for file in files:
             if file.endswith("Jenkinsfile.yml") and root != ".":
                 with open(os.path.join(root, file), 'r') as f:
-                    doc = yaml.load(f, Loader=yaml.FullLoader)
+                    doc = yaml.load(f, Loader=CSafeLoader)
                 module = root.replace(".{}".format(os.sep), '')
                 for stage in doc["stages"]:
                     withModule = False